@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import csv
-import json
 import random
 import string
-from io import StringIO
+from json.encoder import encode_basestring_ascii
 from textwrap import dedent
-from typing import Callable, Dict, List, Sequence, TypedDict, NamedTuple, Tuple
+from typing import Callable, Dict, Iterator, List, Sequence, NamedTuple, Tuple, overload
 
 from inspect_ai import Task, task
 from inspect_ai.dataset import Sample
@@ -83,6 +81,11 @@ DEPARTMENTS = [
     "Data",
 ]
 
+CITIES_JSON: Dict[str, str] = {city: encode_basestring_ascii(city) for city in CITIES}
+DEPARTMENTS_JSON: Dict[str, str] = {
+    department: encode_basestring_ascii(department) for department in DEPARTMENTS
+}
+
 NUMERIC_FIELDS: Dict[str, str] = {
     "salary": "What is {name}'s salary? (Return just the number, e.g. '85200'.)",
     "years_experience": "How many years of experience does {name} have? (Return just the number, e.g. '12'.)",
@@ -90,7 +93,7 @@ NUMERIC_FIELDS: Dict[str, str] = {
     "project_count": "How many projects has {name} completed? (Return just the number, e.g. '15'.)",
 }
 
-class EmployeeRecord(TypedDict):
+class EmployeeRecord(NamedTuple):
     id: int
     name: str
     age: int
@@ -101,7 +104,50 @@ class EmployeeRecord(TypedDict):
     project_count: int
 
 
-class QAEntry(TypedDict):
+class RecordColumns(NamedTuple):
+    ids: Sequence[int]
+    names: Sequence[str]
+    ages: Sequence[int]
+    cities: Sequence[str]
+    departments: Sequence[str]
+    salaries: Sequence[int]
+    years_experience: Sequence[int]
+    project_counts: Sequence[int]
+    ids_s: Sequence[str]
+    ages_s: Sequence[str]
+    salaries_s: Sequence[str]
+    years_experience_s: Sequence[str]
+    project_counts_s: Sequence[str]
+    names_json: Sequence[str]
+    cities_json: Sequence[str]
+    departments_json: Sequence[str]
+
+    def string_rows(self) -> Iterator[Tuple[str, ...]]:
+        return zip(
+            self.ids_s,
+            self.names,
+            self.ages_s,
+            self.cities,
+            self.departments,
+            self.salaries_s,
+            self.years_experience_s,
+            self.project_counts_s,
+        )
+
+    def json_rows(self) -> Iterator[Tuple[str, ...]]:
+        return zip(
+            self.ids_s,
+            self.names_json,
+            self.ages_s,
+            self.cities_json,
+            self.departments_json,
+            self.salaries_s,
+            self.years_experience_s,
+            self.project_counts_s,
+        )
+
+
+class QAEntry(NamedTuple):
     record_id: int
     field: str
     question: str
@@ -111,50 +157,39 @@ class QAEntry(TypedDict):
 class FormatSpec(NamedTuple):
     key: str
     label: str
-    formatter: Callable[[Sequence[EmployeeRecord]], str]
+    formatter: Callable[[RecordColumns], str]
 
 
 def generate_employee_records(count: int, seed: int) -> List[EmployeeRecord]:
     rng = random.Random(seed)
-    used_names = set()
+    # Bound methods hoisted out of the loop; randrange(a, b + 1) is what
+    # randint(a, b) calls, so the draws (and the dataset) are unchanged.
+    randrange = rng.randrange
+    choice = rng.choice
+    used_names: set[str] = set()
     records: List[EmployeeRecord] = []
 
     for idx in range(1, count + 1):
-        name = _random_name(rng, used_names)
-        age = rng.randint(22, 67)
+        while True:
+            name = f"{choice(FIRST_NAMES)} {choice(string.ascii_uppercase)}{randrange(0, 1000):03d}"
+            if name not in used_names:
+                break
+        used_names.add(name)
+        age = randrange(22, 68)
         max_experience = max(0, age - 18)
-        years_experience = rng.randint(0, max_experience)
-        salary = rng.randint(45000, 165000)
-        project_count = rng.randint(0, 60)
-        city = rng.choice(CITIES)
-        department = rng.choice(DEPARTMENTS)
-
-        record: EmployeeRecord = {
-            "id": idx,
-            "name": name,
-            "age": age,
-            "city": city,
-            "department": department,
-            "salary": salary,
-            "years_experience": years_experience,
-            "project_count": project_count,
-        }
-        records.append(record)
+        years_experience = randrange(0, max_experience + 1)
+        salary = randrange(45000, 165001)
+        project_count = randrange(0, 61)
+        city = choice(CITIES)
+        department = choice(DEPARTMENTS)
+
+        records.append(
+            EmployeeRecord(idx, name, age, city, department, salary, years_experience, project_count)
+        )
 
     return records
 
 
-def _random_name(rng: random.Random, used_names: set[str]) -> str:
-    while True:
-        first = rng.choice(FIRST_NAMES)
-        suffix_letter = rng.choice(string.ascii_uppercase)
-        suffix_number = rng.randint(0, 999)
-        candidate = f"{first} {suffix_letter}{suffix_number:03d}"
-        if candidate not in used_names:
-            used_names.add(candidate)
-            return candidate
-
-
 def generate_questions(records: Sequence[EmployeeRecord], count: int, seed: int) -> List[QAEntry]:
     rng = random.Random(seed)
     questions: List[QAEntry] = []
@@ -164,151 +199,245 @@ def generate_questions(records: Sequence[EmployeeRecord], count: int, seed: int)
         record = rng.choice(records)
         field = rng.choice(fields)
         template = NUMERIC_FIELDS[field]
-        question = template.format(name=record["name"])
-        answer = str(record[field])
-        questions.append(
-            QAEntry(
-                record_id=record["id"],
-                field=field,
-                question=question,
-                answer=answer,
-            )
-        )
+        question = template.format(name=record.name)
+        answer = str(getattr(record, field))
+        questions.append(QAEntry(record.id, field, question, answer))
 
     return questions
 
 
-def format_json(records: Sequence[EmployeeRecord]) -> str:
-    payload = [dict(record) for record in records]
-    return json.dumps(payload, indent=2)
+def build_record_columns(records: Sequence[EmployeeRecord]) -> RecordColumns:
+    if records:
+        ids, names, ages, cities, departments, salaries, years_experience, project_counts = zip(*records)
+    else:
+        ids = names = ages = cities = departments = salaries = years_experience = project_counts = ()
+    return RecordColumns(
+        ids=ids,
+        names=names,
+        ages=ages,
+        cities=cities,
+        departments=departments,
+        salaries=salaries,
+        years_experience=years_experience,
+        project_counts=project_counts,
+        ids_s=list(map(str, ids)),
+        ages_s=list(map(str, ages)),
+        salaries_s=list(map(str, salaries)),
+        years_experience_s=list(map(str, years_experience)),
+        project_counts_s=list(map(str, project_counts)),
+        names_json=list(map(encode_basestring_ascii, names)),
+        cities_json=[CITIES_JSON.get(city) or encode_basestring_ascii(city) for city in cities],
+        departments_json=[
+            DEPARTMENTS_JSON.get(department) or encode_basestring_ascii(department)
+            for department in departments
+        ],
+    )
+
+
+def format_json(columns: RecordColumns) -> str:
+    if not columns.ids:
+        return "[]"
+
+    body = ",\n".join(
+        [
+            "  {\n"
+            f'    "id": {id_},\n'
+            f'    "name": {name},\n'
+            f'    "age": {age},\n'
+            f'    "city": {city},\n'
+            f'    "department": {department},\n'
+            f'    "salary": {salary},\n'
+            f'    "years_experience": {years_experience},\n'
+            f'    "project_count": {project_count}\n'
+            "  }"
+            for id_, name, age, city, department, salary, years_experience, project_count in columns.json_rows()
+        ]
+    )
+    return f"[\n{body}\n]"
+
+
+def _needs_csv_quotes(value: str) -> bool:
+    return "," in value or '"' in value or "\n" in value or "\r" in value
+
 
+def _csv_field(value: str) -> str:
+    if not _needs_csv_quotes(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
 
-def format_csv(records: Sequence[EmployeeRecord]) -> str:
-    if not records:
+
+def _csv_column(values: Sequence[str]) -> Sequence[str]:
+    if not _needs_csv_quotes("".join(values)):
+        return values
+    return [_csv_field(value) for value in values]
+
+
+def format_csv(columns: RecordColumns) -> str:
+    if not columns.ids:
         return ""
 
-    fieldnames = list(records[0].keys())
-    buffer = StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-    writer.writeheader()
-    for record in records:
-        writer.writerow(record)
-    return buffer.getvalue().strip()
-
-
-def format_xml(records: Sequence[EmployeeRecord]) -> str:
-    lines = ['<?xml version="1.0" encoding="UTF-8"?>', "<employees>"]
-    for record in records:
-        lines.append(f"  <employee id=\"{record['id']}\">")
-        lines.append(f"    <name>{record['name']}</name>")
-        lines.append(f"    <age>{record['age']}</age>")
-        lines.append(f"    <city>{record['city']}</city>")
-        lines.append(f"    <department>{record['department']}</department>")
-        lines.append(f"    <salary>{record['salary']}</salary>")
-        lines.append(
-            f"    <years_experience>{record['years_experience']}</years_experience>"
+    # Quote like csv.writer's QUOTE_MINIMAL and keep its CRLF line terminator.
+    # Each string column is scanned once and only quoted field-by-field if
+    # it contains a special character, which generated data never does.
+    body = [
+        f"{id_},{name},{age},{city},{department},{salary},{years_experience},{project_count}"
+        for id_, name, age, city, department, salary, years_experience, project_count in zip(
+            columns.ids_s,
+            _csv_column(columns.names),
+            columns.ages_s,
+            _csv_column(columns.cities),
+            _csv_column(columns.departments),
+            columns.salaries_s,
+            columns.years_experience_s,
+            columns.project_counts_s,
         )
-        lines.append(f"    <project_count>{record['project_count']}</project_count>")
-        lines.append("  </employee>")
-    lines.append("</employees>")
-    return "\n".join(lines)
-
-
-def format_yaml(records: Sequence[EmployeeRecord]) -> str:
-    lines = ["records:"]
-    for record in records:
-        lines.append(f"  - id: {record['id']}")
-        lines.append(f"    name: \"{record['name']}\"")
-        lines.append(f"    age: {record['age']}")
-        lines.append(f"    city: \"{record['city']}\"")
-        lines.append(f"    department: \"{record['department']}\"")
-        lines.append(f"    salary: {record['salary']}")
-        lines.append(f"    years_experience: {record['years_experience']}")
-        lines.append(f"    project_count: {record['project_count']}")
-    return "\n".join(lines)
-
-
-def format_html(records: Sequence[EmployeeRecord]) -> str:
-    if not records:
+    ]
+    return "\r\n".join([",".join(EmployeeRecord._fields), *body])
+
+
+def format_xml(columns: RecordColumns) -> str:
+    body = [
+        f'  <employee id="{id_}">\n'
+        f"    <name>{name}</name>\n"
+        f"    <age>{age}</age>\n"
+        f"    <city>{city}</city>\n"
+        f"    <department>{department}</department>\n"
+        f"    <salary>{salary}</salary>\n"
+        f"    <years_experience>{years_experience}</years_experience>\n"
+        f"    <project_count>{project_count}</project_count>\n"
+        "  </employee>"
+        for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+    ]
+    return "\n".join(['<?xml version="1.0" encoding="UTF-8"?>', "<employees>", *body, "</employees>"])
+
+
+def format_yaml(columns: RecordColumns) -> str:
+    body = [
+        f"  - id: {id_}\n"
+        f'    name: "{name}"\n'
+        f"    age: {age}\n"
+        f'    city: "{city}"\n'
+        f'    department: "{department}"\n'
+        f"    salary: {salary}\n"
+        f"    years_experience: {years_experience}\n"
+        f"    project_count: {project_count}"
+        for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+    ]
+    return "\n".join(["records:", *body])
+
+
+def format_html(columns: RecordColumns) -> str:
+    if not columns.ids:
         return ""
 
-    headers = list(records[0].keys())
-    lines = ["<table>", "  <thead>", "    <tr>"]
-    for header in headers:
-        lines.append(f"      <th scope=\"col\">{header}</th>")
-    lines.extend(["    </tr>", "  </thead>", "  <tbody>"])
-    for record in records:
-        lines.append("    <tr>")
-        for header in headers:
-            lines.append(f"      <td>{record[header]}</td>")
-        lines.append("    </tr>")
-    lines.extend(["  </tbody>", "</table>"])
-    return "\n".join(lines)
-
-
-def format_markdown_table(records: Sequence[EmployeeRecord]) -> str:
-    if not records:
+    header_cells = [f'      <th scope="col">{header}</th>' for header in EmployeeRecord._fields]
+    body = [
+        "    <tr>\n"
+        f"      <td>{id_}</td>\n"
+        f"      <td>{name}</td>\n"
+        f"      <td>{age}</td>\n"
+        f"      <td>{city}</td>\n"
+        f"      <td>{department}</td>\n"
+        f"      <td>{salary}</td>\n"
+        f"      <td>{years_experience}</td>\n"
+        f"      <td>{project_count}</td>\n"
+        "    </tr>"
+        for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+    ]
+    return "\n".join(
+        [
+            "<table>",
+            "  <thead>",
+            "    <tr>",
+            *header_cells,
+            "    </tr>",
+            "  </thead>",
+            "  <tbody>",
+            *body,
+            "  </tbody>",
+            "</table>",
+        ]
+    )
+
+
+def format_markdown_table(columns: RecordColumns) -> str:
+    if not columns.ids:
         return ""
 
-    headers = list(records[0].keys())
+    headers = EmployeeRecord._fields
     header_row = "| " + " | ".join(headers) + " |"
     divider_row = "| " + " | ".join(["---"] * len(headers)) + " |"
-    body_rows = []
-    for record in records:
-        row = "| " + " | ".join(str(record[h]) for h in headers) + " |"
-        body_rows.append(row)
+    body_rows = [
+        f"| {id_} | {name} | {age} | {city} | {department} | {salary} | {years_experience} | {project_count} |"
+        for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+    ]
     return "\n".join([header_row, divider_row, *body_rows])
 
 
-def format_markdown_kv(records: Sequence[EmployeeRecord]) -> str:
-    lines = ["# Employee Database"]
-    for record in records:
-        lines.append("")
-        lines.append(f"## Record {record['id']}")
-        lines.append("")
-        lines.append("```")
-        for key, value in record.items():
-            lines.append(f"{key}: {value}")
-        lines.append("```")
-    return "\n".join(lines)
-
-
-def format_ini(records: Sequence[EmployeeRecord]) -> str:
-    lines: List[str] = []
-    for record in records:
-        lines.append(f"[employee_{record['id']}]")
-        for key, value in record.items():
-            lines.append(f"{key} = {value}")
-        lines.append("")
-    return "\n".join(lines).strip()
-
+def format_markdown_kv(columns: RecordColumns) -> str:
+    body = [
+        f"## Record {id_}\n"
+        "\n"
+        "```\n"
+        f"id: {id_}\n"
+        f"name: {name}\n"
+        f"age: {age}\n"
+        f"city: {city}\n"
+        f"department: {department}\n"
+        f"salary: {salary}\n"
+        f"years_experience: {years_experience}\n"
+        f"project_count: {project_count}\n"
+        "```"
+        for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+    ]
+    return "\n\n".join(["# Employee Database", *body])
+
+
+def format_ini(columns: RecordColumns) -> str:
+    return "\n\n".join(
+        [
+            f"[employee_{id_}]\n"
+            f"id = {id_}\n"
+            f"name = {name}\n"
+            f"age = {age}\n"
+            f"city = {city}\n"
+            f"department = {department}\n"
+            f"salary = {salary}\n"
+            f"years_experience = {years_experience}\n"
+            f"project_count = {project_count}"
+            for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+        ]
+    )
 
-def format_pipe_delimited(records: Sequence[EmployeeRecord]) -> str:
-    if not records:
-        return ""
 
-    headers = list(records[0].keys())
-    rows = []
-    for record in records:
-        parts = [f"{header}: {record[header]}" for header in headers]
-        rows.append(" | ".join(parts))
-    return "\n".join(rows)
+def format_pipe_delimited(columns: RecordColumns) -> str:
+    return "\n".join(
+        [
+            f"id: {id_} | name: {name} | age: {age} | city: {city} | department: {department} | "
+            f"salary: {salary} | years_experience: {years_experience} | project_count: {project_count}"
+            for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+        ]
+    )
 
 
-def format_jsonl(records: Sequence[EmployeeRecord]) -> str:
-    return "\n".join(json.dumps(record) for record in records)
+def format_jsonl(columns: RecordColumns) -> str:
+    return "\n".join(
+        [
+            f'{{"id": {id_}, "name": {name}, "age": {age}, "city": {city}, "department": {department}, '
+            f'"salary": {salary}, "years_experience": {years_experience}, "project_count": {project_count}}}'
+            for id_, name, age, city, department, salary, years_experience, project_count in columns.json_rows()
+        ]
+    )
 
 
-def format_natural_language(records: Sequence[EmployeeRecord]) -> str:
-    lines = ["Employee Records Summary:"]
-    for record in records:
-        lines.append("")
-        lines.append(
-            f"{record['name']} (ID: {record['id']}) is a {record['age']}-year-old employee working in the "
-            f"{record['department']} department in {record['city']}. They earn ${record['salary']} with "
-            f"{record['years_experience']} years of experience and have completed {record['project_count']} projects."
-        )
-    return "\n".join(lines)
+def format_natural_language(columns: RecordColumns) -> str:
+    body = [
+        f"{name} (ID: {id_}) is a {age}-year-old employee working in the "
+        f"{department} department in {city}. They earn ${salary} with "
+        f"{years_experience} years of experience and have completed {project_count} projects."
+        for id_, name, age, city, department, salary, years_experience, project_count in columns.string_rows()
+    ]
+    return "\n\n".join(["Employee Records Summary:", *body])
 
 
 FORMAT_SPECS: Dict[str, FormatSpec] = {
@@ -340,9 +469,11 @@ FORMAT_ORDER = [
 ]
 
 RECORDS_CACHE: Dict[int, List[EmployeeRecord]] = {}
+COLUMNS_CACHE: Dict[int, RecordColumns] = {}
 QUESTIONS_CACHE: Dict[Tuple[int, int], List[QAEntry]] = {}
 FORMATTED_CACHE: Dict[Tuple[str, int], str] = {}
-SAMPLES_CACHE: Dict[Tuple[str, int, int], List[Sample]] = {}
+PREFIX_CACHE: Dict[Tuple[str, int], str] = {}
+SAMPLES_CACHE: Dict[Tuple[str, int, int], LazySamples] = {}
 
 SYSTEM_PROMPT = dedent(
     """
@@ -353,6 +484,17 @@ SYSTEM_PROMPT = dedent(
     """
 ).strip()
 
+PROMPT_INTRO = dedent(
+    """
+    You are provided with {num_records} employee records formatted as {label}.
+    Each record includes the fields: id, name, age, city, department, salary, years_experience, project_count.
+    Use the data to answer the question.
+    DATA START
+    """
+).strip()
+
+PROMPT_OUTRO = "DATA END"
+
 SCORER = match(location="exact", ignore_case=False, numeric=True)
 
 
@@ -364,6 +506,12 @@ def get_records(num_records: int) -> List[EmployeeRecord]:
     return RECORDS_CACHE[num_records]
 
 
+def get_columns(num_records: int) -> RecordColumns:
+    if num_records not in COLUMNS_CACHE:
+        COLUMNS_CACHE[num_records] = build_record_columns(get_records(num_records))
+    return COLUMNS_CACHE[num_records]
+
+
 def get_questions(num_records: int, num_questions: int) -> List[QAEntry]:
     if num_questions <= 0:
         raise ValueError("num_questions must be greater than zero")
@@ -377,12 +525,73 @@ def get_questions(num_records: int, num_questions: int) -> List[QAEntry]:
 def get_formatted_data(format_key: str, num_records: int) -> str:
     key = (format_key, num_records)
     if key not in FORMATTED_CACHE:
-        records = get_records(num_records)
-        FORMATTED_CACHE[key] = FORMAT_SPECS[format_key].formatter(records)
+        columns = get_columns(num_records)
+        FORMATTED_CACHE[key] = FORMAT_SPECS[format_key].formatter(columns)
     return FORMATTED_CACHE[key]
 
 
-def build_samples(format_key: str, num_records: int, num_questions: int) -> List[Sample]:
+def get_prompt_prefix(format_key: str, num_records: int) -> str:
+    key = (format_key, num_records)
+    if key not in PREFIX_CACHE:
+        spec = FORMAT_SPECS[format_key]
+        dataset_block = get_formatted_data(format_key, num_records)
+        intro = PROMPT_INTRO.format(num_records=num_records, label=spec.label)
+        PREFIX_CACHE[key] = f"{intro}\n\n{dataset_block}\n{PROMPT_OUTRO}\n\nQuestion: "
+    return PREFIX_CACHE[key]
+
+
+class LazySamples(Sequence[Sample]):
+    def __init__(
+        self,
+        format_key: str,
+        num_records: int,
+        num_questions: int,
+        prefix: str,
+        questions: Sequence[QAEntry],
+    ) -> None:
+        self.format_key = format_key
+        self.num_records = num_records
+        self.num_questions = num_questions
+        self.prefix = prefix
+        self.questions = questions
+        self.label = FORMAT_SPECS[format_key].label
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    @overload
+    def __getitem__(self, index: int) -> Sample: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Sample]: ...
+
+    def __getitem__(self, index: int | slice) -> Sample | List[Sample]:
+        positions = range(len(self.questions))[index]
+        if isinstance(positions, range):
+            return [self._build(idx) for idx in positions]
+        return self._build(positions)
+
+    def _build(self, idx: int) -> Sample:
+        record_id, field, question, answer = self.questions[idx]
+        return Sample(
+            id=f"{self.format_key}-{idx}",
+            # One f-string builds the prompt in a single allocation; chained +
+            # would copy the large prefix twice.
+            input=f"{self.prefix}{question}\nAnswer:",
+            target=answer,
+            metadata={
+                "format": self.format_key,
+                "format_label": self.label,
+                "record_id": record_id,
+                "field": field,
+                "question": question,
+                "num_records": self.num_records,
+                "num_questions": self.num_questions,
+            },
+        )
+
+
+def build_samples(format_key: str, num_records: int, num_questions: int) -> LazySamples:
     cache_key = (format_key, num_records, num_questions)
     if cache_key in SAMPLES_CACHE:
         return SAMPLES_CACHE[cache_key]
@@ -390,45 +599,9 @@ def build_samples(format_key: str, num_records: int, num_questions: int) -> List
     if format_key not in FORMAT_SPECS:
         raise KeyError(f"Unknown format: {format_key}")
 
-    spec = FORMAT_SPECS[format_key]
-    dataset_block = get_formatted_data(format_key, num_records)
+    prefix = get_prompt_prefix(format_key, num_records)
     questions = get_questions(num_records, num_questions)
-
-    intro = dedent(
-        f"""
-        You are provided with {num_records} employee records formatted as {spec.label}.
-        Each record includes the fields: id, name, age, city, department, salary, years_experience, project_count.
-        Use the data to answer the question.
-        DATA START
-        """
-    ).strip()
-
-    outro = "DATA END"
-
-    samples: List[Sample] = []
-    for idx, qa in enumerate(questions):
-        prompt = (
-            f"{intro}\n\n{dataset_block}\n{outro}\n\n"
-            f"Question: {qa['question']}\n"
-            "Answer:"
-        )
-        samples.append(
-            Sample(
-                id=f"{format_key}-{idx}",
-                input=prompt,
-                target=qa["answer"],
-                metadata={
-                    "format": format_key,
-                    "format_label": spec.label,
-                    "record_id": qa["record_id"],
-                    "field": qa["field"],
-                    "question": qa["question"],
-                    "num_records": num_records,
-                    "num_questions": num_questions,
-                },
-            )
-        )
-
+    samples = LazySamples(format_key, num_records, num_questions, prefix, questions)
     SAMPLES_CACHE[cache_key] = samples
     return samples
 
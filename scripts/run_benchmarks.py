@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 import argparse
+import json
+import logging
 import os
+import shlex
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, zip_longest
 from pathlib import Path
-from typing import Iterable, List
+from threading import Event, Lock, Semaphore
+from typing import Callable, Dict, Iterable, List, Sequence, TextIO, Tuple
 
 FORMAT_KEYS: List[str] = [
     "json",
@@ -22,24 +32,189 @@ FORMAT_KEYS: List[str] = [
     "natural_language",
 ]
 
+logger = logging.getLogger("run_benchmarks")
 
+# Default cap on concurrent evals per model provider (the model id prefix before
+# "/"). Providers not listed here are only bounded by --jobs.
+PROVIDER_LIMITS: Dict[str, int] = {
+    "openai": 8,
+    "anthropic": 4,
+}
+
+# Exit status used for, and recognised as, a run the user interrupted rather than
+# one that failed (128 + SIGINT / SIGTERM, as reported by a shell).
+INTERRUPTED = 130
+_INTERRUPTED_CODES = frozenset({INTERRUPTED, 143})
+
+_SANITIZE_TABLE = str.maketrans({"/": "_", ":": "_", " ": "_"})
+
+
+@lru_cache(maxsize=1)
 def resolve_inspect_bin() -> str:
     env_override = os.environ.get("INSPECT_BIN")
     if env_override:
         return env_override
 
     candidates = [
-        Path(sys.prefix) / "bin" / "inspect",
-        Path(sys.prefix) / "Scripts" / "inspect.exe",
+        os.path.join(sys.prefix, "bin", "inspect"),
+        os.path.join(sys.prefix, "Scripts", "inspect.exe"),
     ]
     for candidate in candidates:
-        if candidate.exists():
-            return str(candidate)
+        if os.access(candidate, os.X_OK):
+            return candidate
     return "inspect"
 
 
+@lru_cache(maxsize=None)
 def sanitize(segment: str) -> str:
-    return segment.replace("/", "_").replace(":", "_").replace(" ", "_")
+    return segment.translate(_SANITIZE_TABLE)
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def provider_of(model: str) -> str:
+    return model.split("/", 1)[0]
+
+
+def parse_provider_limits(spec: str) -> Dict[str, int]:
+    limits: Dict[str, int] = {}
+    for item in spec.split(","):
+        provider, sep, value = item.strip().partition("=")
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = 0
+        if not sep or not provider or limit < 1:
+            raise argparse.ArgumentTypeError(
+                f"invalid provider limit {item!r} (expected provider=N with N >= 1)"
+            )
+        limits[provider] = limit
+    return limits
+
+
+def _interleave_by_provider(pairs: Sequence[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    # Round-robin across providers so workers waiting on one provider's cap
+    # don't hold back runs queued for another provider.
+    groups: Dict[str, List[Tuple[str, str]]] = {}
+    for pair in pairs:
+        groups.setdefault(provider_of(pair[0]), []).append(pair)
+    return [pair for pair in chain.from_iterable(zip_longest(*groups.values())) if pair is not None]
+
+
+def _precreate_logdirs(log_dirs: Iterable[Path]) -> None:
+    for log_dir in log_dirs:
+        os.makedirs(log_dir, exist_ok=True)
+
+
+def _stream_subprocess(
+    cmd: Sequence[str], log_path: Path | None, prefix: str, attempt: int = 0
+) -> int:
+    # Retries append to the first attempt's log so the failed output survives.
+    log_mode = "a" if attempt else "w"
+    log_context = open(log_path, log_mode, encoding="utf-8") if log_path is not None else nullcontext()
+    with log_context as log_file, subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ) as process:
+        if log_file is not None and attempt:
+            log_file.write(f"\n--- retry {attempt} ---\n")
+        for line in process.stdout:
+            if log_file is not None:
+                log_file.write(line)
+            sys.stdout.write(f"{prefix} {line}")
+
+    return process.returncode
+
+
+class _Skipped(Exception):
+    pass
+
+
+def _run_one(
+    model: str,
+    fmt: str,
+    cmd: Sequence[str],
+    log_dir: Path | None,
+    dry_run: bool = False,
+    attempt: int = 0,
+) -> int:
+    if dry_run:
+        # One write per run so listings from concurrent workers don't interleave.
+        sys.stdout.write(f"{shlex.join(cmd)}\n  log dir: {log_dir}\n")
+        return 0
+
+    logger.info(f"→ Running {fmt} format on {model}...")
+    log_path = log_dir / "stdout.log" if log_dir is not None else None
+    try:
+        return _stream_subprocess(cmd, log_path, prefix=f"[{model}/{fmt}]", attempt=attempt)
+    except Exception:
+        logger.exception(f"Could not run {fmt} format on {model}")
+        return 1
+
+
+def _run_in_process(
+    model: str,
+    fmt: str,
+    task_name: str,
+    limit: int | None,
+    log_dir: Path | None,
+    task_args: Dict[str, int],
+    dry_run: bool = False,
+) -> int:
+    log_dir_arg = str(log_dir) if log_dir is not None else None
+    if dry_run:
+        sys.stdout.write(
+            f"inspect_ai.eval({task_name!r}, model={model!r}, limit={limit!r}, "
+            f"log_dir={log_dir_arg!r}, task_args={task_args!r})\n"
+        )
+        return 0
+
+    from inspect_ai import eval as inspect_eval
+
+    logger.info(f"→ Running {fmt} format on {model}...")
+    try:
+        logs = inspect_eval(
+            task_name,
+            model=model,
+            limit=limit,
+            log_dir=log_dir_arg,
+            task_args=task_args,
+        )
+    except Exception:
+        # eval() raises rather than returning an error log for setup problems
+        # such as an unknown provider or a missing API key.
+        logger.exception(f"Inspect raised while running {fmt} format on {model}")
+        return 1
+    if any(log.status == "cancelled" for log in logs):
+        return INTERRUPTED
+    return 0 if all(log.status == "success" for log in logs) else 1
+
+
+def _was_interrupted(returncode: int) -> bool:
+    # Popen reports a child killed by a signal with a negative return code.
+    return returncode < 0 or returncode in _INTERRUPTED_CODES
+
+
+def _with_retries(run: Callable[[int], int], retries: int, model: str, fmt: str) -> int:
+    returncode = run(0)
+    for attempt in range(retries):
+        if returncode == 0 or _was_interrupted(returncode):
+            break
+        delay = 2**attempt
+        logger.warning(
+            f"↻ Eval failed for format={fmt}, model={model} (exit code {returncode}); "
+            f"retrying in {delay}s ({attempt + 1}/{retries})"
+        )
+        time.sleep(delay)
+        returncode = run(attempt + 1)
+    return returncode
 
 
 def run_evaluations(
@@ -50,39 +225,176 @@ def run_evaluations(
     extra_args: Iterable[str],
     num_records: int | None,
     num_questions: int | None,
-) -> None:
-    inspect_bin = resolve_inspect_bin()
+    jobs: int = 1,
+    in_process: bool = False,
+    dry_run: bool = False,
+    provider_limits: Dict[str, int] | None = None,
+    retries: int = 0,
+    fail_fast: bool = False,
+) -> List[Tuple[str, str, int | None]]:
+    models = list(models)
+    formats = list(formats)
+    pairs = [(model, fmt) for model in models for fmt in formats]
+
+    task_names = {fmt: f"evals/table_formats_eval.py@table_formats_{fmt}" for fmt in formats}
+    model_labels = {model: sanitize(model) for model in models}
+    log_dirs: Dict[Tuple[str, str], Path | None] = {
+        (model, fmt): log_root / model_labels[model] / fmt if log_root is not None else None
+        for model, fmt in pairs
+    }
+
+    task_args: Dict[str, int] = {}
+    if num_records is not None:
+        task_args["num_records"] = num_records
+    if num_questions is not None:
+        task_args["num_questions"] = num_questions
+
+    limit_args = ["--limit", str(limit)] if limit is not None else []
+    trailing_args = [arg for name, value in task_args.items() for arg in ("-T", f"{name}={value}")]
+    trailing_args.extend(extra_args)
+
+    if log_root is not None and not dry_run:
+        _precreate_logdirs(log_dirs.values())
+
+    # A returncode of None marks an eval that never ran because the grid was stopped early.
+    failures: List[Tuple[str, str, int | None]] = []
+
+    def record(model: str, fmt: str, returncode: int) -> None:
+        if returncode == 0:
+            return
+        message = f"✖ Eval failed for format={fmt}, model={model} (exit code {returncode})"
+        if log_root is not None:
+            message += f"; Inspect logs: {log_dirs[(model, fmt)]}"
+        logger.error(message)
+        failures.append((model, fmt, returncode))
+
+    index_path = log_root / "index.jsonl" if log_root is not None and not dry_run else None
+    index_lock = Lock()
 
-    for model in models:
-        model_label = sanitize(model)
-        for fmt in formats:
-            task_name = f"evals/table_formats_eval.py@table_formats_{fmt}"
-            print(f"\n→ Running {fmt} format on {model}...")
+    def indexed(
+        index_file: TextIO | None,
+        model: str,
+        fmt: str,
+        cmd: Sequence[str] | None,
+        run: Callable[..., int],
+        *args,
+    ) -> int:
+        started_at = _timestamp()
+        returncode = run(*args)
+        if index_file is not None:
+            entry = {
+                "model": model,
+                "fmt": fmt,
+                "cmd": cmd,
+                "started_at": started_at,
+                "ended_at": _timestamp(),
+                "returncode": returncode,
+                "log_dir": str(log_dirs[(model, fmt)]),
+            }
+            line = json.dumps(entry) + "\n"
+            with index_lock:
+                index_file.write(line)
+                index_file.flush()
+        return returncode
 
-            cmd = [inspect_bin, "eval", task_name, "--model", model]
-            if limit is not None:
-                cmd.extend(["--limit", str(limit)])
+    index_context = open(index_path, "a", encoding="utf-8") if index_path is not None else nullcontext()
+    with index_context as index_file:
+        if in_process:
+            # Inspect's eval() drives its own event loop and display, so in-process
+            # runs stay sequential on the main thread.
+            for model, fmt in pairs:
+                run_args = (model, fmt, task_names[fmt], limit, log_dirs[(model, fmt)], task_args, dry_run)
+                returncode = _with_retries(
+                    lambda attempt: indexed(index_file, model, fmt, None, _run_in_process, *run_args),
+                    retries,
+                    model,
+                    fmt,
+                )
+                record(model, fmt, returncode)
+                if _was_interrupted(returncode) or (returncode != 0 and fail_fast):
+                    remaining = pairs[pairs.index((model, fmt)) + 1 :]
+                    failures.extend((model, fmt, None) for model, fmt in remaining)
+                    break
+        else:
+            inspect_bin = resolve_inspect_bin()
 
-            log_dir = None
-            if log_root is not None:
-                log_dir = log_root / model_label / fmt
-                log_dir.mkdir(parents=True, exist_ok=True)
-                cmd.extend(["--log-dir", str(log_dir)])
+            def build_cmd(model: str, fmt: str) -> List[str]:
+                log_dir = log_dirs[(model, fmt)]
+                log_args = ["--log-dir", str(log_dir)] if log_dir is not None else []
+                return [
+                    inspect_bin,
+                    "eval",
+                    task_names[fmt],
+                    "--model",
+                    model,
+                    *limit_args,
+                    *log_args,
+                    *trailing_args,
+                ]
 
-            if num_records is not None:
-                cmd.extend(["-T", f"num_records={num_records}"])
-            if num_questions is not None:
-                cmd.extend(["-T", f"num_questions={num_questions}"])
+            limits = PROVIDER_LIMITS if provider_limits is None else provider_limits
+            providers = {provider_of(model) for model in models}
+            slots: Dict[str, AbstractContextManager] = {
+                provider: Semaphore(limits[provider]) if limits.get(provider, jobs) < jobs else nullcontext()
+                for provider in providers
+            }
 
-            cmd.extend(extra_args)
+            # Set when the grid is being torn down (Ctrl-C, or a failure under
+            # --fail-fast); workers check it before launching anything so queued
+            # or retrying evals never start.
+            stop = Event()
 
-            try:
-                subprocess.run(cmd, check=True)
-            except subprocess.CalledProcessError as exc:
-                print(f"✖ Eval failed for format={fmt}, model={model} (exit code {exc.returncode})")
-                if log_dir is not None:
-                    print(f"  Inspect logs: {log_dir}")
-                raise
+            def run_pair(index_file: TextIO | None, model: str, fmt: str) -> int | None:
+                cmd = build_cmd(model, fmt)
+                log_dir = log_dirs[(model, fmt)]
+                slot = slots[provider_of(model)]
+
+                def run_attempt(attempt: int) -> int:
+                    with slot:
+                        if stop.is_set():
+                            raise _Skipped
+                        return _run_one(model, fmt, cmd, log_dir, dry_run, attempt)
+
+                try:
+                    returncode = _with_retries(
+                        lambda attempt: indexed(index_file, model, fmt, cmd, run_attempt, attempt),
+                        retries,
+                        model,
+                        fmt,
+                    )
+                except _Skipped:
+                    return None
+                if returncode != 0 and fail_fast:
+                    stop.set()
+                return returncode
+
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(run_pair, index_file, model, fmt): (model, fmt)
+                    for model, fmt in _interleave_by_provider(pairs)
+                }
+                try:
+                    for future in as_completed(futures):
+                        model, fmt = futures[future]
+                        returncode = None if future.cancelled() else future.result()
+                        if returncode is None:
+                            failures.append((model, fmt, None))
+                            continue
+                        record(model, fmt, returncode)
+                        if returncode != 0 and fail_fast:
+                            cancelled = sum(f.cancel() for f in futures if not f.done())
+                            if cancelled:
+                                logger.warning(f"Cancelled {cancelled} pending evals (--fail-fast)")
+                except BaseException:
+                    # Leaving the with-block waits for the pool, so drop queued
+                    # evals first; only the ones already running are waited on.
+                    stop.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+    order = {pair: index for index, pair in enumerate(pairs)}
+    failures.sort(key=lambda failure: order[failure[:2]])
+    return failures
 
 
 def main() -> None:
@@ -129,6 +441,43 @@ def main() -> None:
         action="store_true",
         help="Disable per-run log directories",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of evals to run concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--provider-limits",
+        type=parse_provider_limits,
+        default={},
+        metavar="PROVIDER=N[,...]",
+        help=(
+            "Cap concurrent evals per model provider, e.g. openai=8,anthropic=4 "
+            "(overrides the built-in defaults for the providers given)"
+        ),
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Times to retry a failed eval, with exponential backoff (default: 2)",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop scheduling new evals after the first eval fails (implies --retries 0)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run evals through Inspect's Python API in this process instead of spawning `inspect eval`",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the command for every (model, format) run without launching any evals",
+    )
     parser.add_argument(
         "--inspect-args",
         nargs=argparse.REMAINDER,
@@ -137,13 +486,22 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(threadName)s %(message)s")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.retries < 0:
+        parser.error("--retries must not be negative")
+    if args.in_process and args.jobs > 1:
+        parser.error("--in-process runs evals sequentially and cannot be combined with --jobs")
+    if args.in_process and args.inspect_args:
+        parser.error("--inspect-args only applies to `inspect eval` subprocesses, not --in-process")
 
     log_root = None if args.no_logs else args.log_dir
 
-    if log_root is not None:
+    if log_root is not None and not args.dry_run:
         log_root.mkdir(parents=True, exist_ok=True)
 
-    run_evaluations(
+    failures = run_evaluations(
         models=args.models,
         formats=args.formats,
         limit=args.limit,
@@ -151,8 +509,26 @@ def main() -> None:
         extra_args=args.inspect_args,
         num_records=args.num_records,
         num_questions=args.num_questions,
+        jobs=args.jobs,
+        in_process=args.in_process,
+        dry_run=args.dry_run,
+        provider_limits={**PROVIDER_LIMITS, **args.provider_limits},
+        retries=0 if args.fail_fast else args.retries,
+        fail_fast=args.fail_fast,
     )
 
+    if failures:
+        total = len(args.models) * len(args.formats)
+        model_width = max(len(model) for model, _, _ in failures)
+        fmt_width = max(len(fmt) for _, fmt, _ in failures)
+        failed = sum(code is not None for _, _, code in failures)
+        skipped = len(failures) - failed
+        print(f"\n{failed} of {total} evals failed" + (f", {skipped} not run:" if skipped else ":"))
+        for model, fmt, code in failures:
+            status = "not run" if code is None else f"exit code {code}"
+            print(f"  {model:<{model_width}}  {fmt:<{fmt_width}}  {status}")
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()